@@ -11,6 +11,8 @@ class Settings(BaseSettings):
     TESTNET: bool = True
     API_KEY: str = ""
     SECRET_KEY: str = ""
+    # Optional shared cache for price/balance lookups, e.g. redis://localhost:6379/0
+    REDIS_URL: str = ""
 
 
 settings = Settings()
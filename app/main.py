@@ -1,18 +1,58 @@
 import asyncio
+import atexit
+import functools
+import json
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+
 import typer
+from rich import box
 from rich.console import Console
 from rich.table import Table
-from binance.enums import SIDE_BUY, SIDE_SELL
 
+from app.services import daemon
 from app.services.logger import setup_logger
-from app.services.trade_service import TradeService
-from app.core.config import settings
 
 app = typer.Typer(
     name="binance-bot", help="Binance Futures Trading Bot CLI", add_completion=False
 )
 console = Console()
 
+# Open-order rows printed per chunk on a terminal
+_ORDER_ROWS_PER_REFRESH = 50
+
+_OPEN_ORDER_COLUMNS = (
+    ("Order ID", "cyan"),
+    ("Symbol", "magenta"),
+    ("Side", "yellow"),
+    ("Type", "blue"),
+    ("Quantity", "green"),
+    ("Price", "green"),
+)
+
+# How Binance spells an empty position's positionAmt
+_ZERO_AMOUNTS = frozenset({"0"} | {"0." + "0" * n for n in range(1, 9)})
+
+# (label, response key) pairs shown for placed orders
+_ORDER_FIELDS = (
+    ("Order ID", "orderId"),
+    ("Symbol", "symbol"),
+    ("Side", "side"),
+    ("Type", "type"),
+    ("Quantity", "origQty"),
+    ("Price", "price"),
+    ("Stop Price", "stopPrice"),
+    ("Status", "status"),
+)
+
+
+@functools.cache
+def _settings():
+    """Load settings on first use so --help and usage errors skip env parsing"""
+    from app.core.config import settings
+
+    return settings
+
 
 class State:
     def __init__(self):
@@ -21,6 +61,10 @@ class State:
         self.secret_key: str = ""
         self.verbose: bool = False
         self.logger = None
+        # One event loop and AsyncClient per process, shared by every command
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.client = None
+        self.client_key: tuple | None = None
 
 
 state = State()
@@ -52,9 +96,9 @@ def main_callback(
     """
 
     state.testnet = testnet
-    state.api_key = api_key or settings.API_KEY
+    state.api_key = api_key or _settings().API_KEY
     state.verbose = verbose
-    state.secret_key = secret_key or settings.SECRET_KEY
+    state.secret_key = secret_key or _settings().SECRET_KEY
 
     state.logger = setup_logger(verbose=False)
 
@@ -68,8 +112,103 @@ def main_callback(
 
 
 def run_async(coro):
-    """Wrapper to run async functions in Typer commands"""
-    return asyncio.run(coro)
+    """Wrapper to run async functions in Typer commands on the shared loop"""
+    if state.loop is None:
+        state.loop = asyncio.new_event_loop()
+        atexit.register(_close_loop)
+
+    task = state.loop.create_task(coro)
+    try:
+        return state.loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        # Let the command unwind its context managers like asyncio.run would
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            state.loop.run_until_complete(task)
+        raise
+
+
+def _close_loop():
+    if state.client is not None:
+        from app.services.trade_service import close_client
+
+        state.loop.run_until_complete(close_client(state.client))
+        state.client = None
+    state.loop.run_until_complete(state.loop.shutdown_asyncgens())
+    state.loop.close()
+
+
+async def _shared_client():
+    """Connect on first use; later commands in this process reuse the client"""
+    # Imported here: it pulls in python-binance and the settings module
+    from app.services.trade_service import close_client, create_client
+
+    key = (state.testnet, state.api_key, state.secret_key)
+    if state.client is not None and state.client_key == key:
+        return state.client
+
+    # Connect before closing the old client so the pooled connections survive
+    previous = state.client
+    state.client = await create_client(
+        state.logger, state.testnet, state.api_key, state.secret_key
+    )
+    state.client_key = key
+    if previous is not None:
+        await close_client(previous)
+    return state.client
+
+
+def _new_service(client=None, stream_prices: bool = False):
+    """Build a TradeService for the current CLI state"""
+    from app.services.trade_service import TradeService
+
+    return TradeService(
+        logger=state.logger,
+        testnet=state.testnet,
+        api_key=state.api_key,
+        secret_key=state.secret_key,
+        client=client,
+        stream_prices=stream_prices,
+    )
+
+
+@asynccontextmanager
+async def _open_service():
+    """Use the running daemon's connection if there is one, else open our own"""
+    client = await daemon.connect(testnet=state.testnet, api_key=state.api_key)
+    if client is not None:
+        yield client
+        return
+
+    async with _new_service(client=await _shared_client()) as service:
+        yield service
+
+
+@app.command("daemon")
+def run_daemon():
+    """
+    Keep one Binance connection open and serve other commands through it
+
+    Other commands started while the daemon runs (same mode and API key)
+    are sent over a local socket instead of connecting to Binance themselves.
+
+    Example: daemon
+    """
+
+    async def execute():
+        client = await _shared_client()
+        # Price queries are answered from WebSocket ticks once a symbol is seen
+        async with _new_service(client=client, stream_prices=True) as service:
+            console.print(
+                f"[green]Daemon listening on {daemon.SOCKET_PATH}[/green] "
+                "(Ctrl+C to stop)"
+            )
+            await daemon.serve(service, testnet=state.testnet, api_key=state.api_key)
+
+    try:
+        run_async(execute())
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Daemon stopped[/yellow]")
 
 
 @app.command("market")
@@ -85,12 +224,7 @@ def market_order(
     """
 
     async def execute():
-        async with TradeService(
-            logger=state.logger,
-            testnet=state.testnet,
-            api_key=state.api_key,
-            secret_key=state.secret_key,
-        ) as service:
+        async with _open_service() as service:
             order = await service.place_futures_market_order(
                 symbol=symbol.upper(), side=side.upper(), quantity=quantity
             )
@@ -115,12 +249,7 @@ def limit_order(
     """
 
     async def execute():
-        async with TradeService(
-            logger=state.logger,
-            testnet=state.testnet,
-            api_key=state.api_key,
-            secret_key=state.secret_key,
-        ) as service:
+        async with _open_service() as service:
             order = await service.place_futures_limit_order(
                 symbol=symbol.upper(), side=side.upper(), quantity=quantity, price=price
             )
@@ -146,12 +275,7 @@ def stop_limit_order(
     """
 
     async def execute():
-        async with TradeService(
-            logger=state.logger,
-            testnet=state.testnet,
-            api_key=state.api_key,
-            secret_key=state.secret_key,
-        ) as service:
+        async with _open_service() as service:
             order = await service.place_stop_limit_order(
                 symbol=symbol.upper(),
                 side=side.upper(),
@@ -166,9 +290,54 @@ def stop_limit_order(
     run_async(execute())
 
 
+@app.command("batch")
+def batch_orders(
+    file: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="JSON file with a list of orders"
+    ),
+):
+    """
+    Place several orders from a JSON file using Binance batch requests
+
+    Each order uses Binance field names, e.g.
+    {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": 0.001}
+
+    Example: batch orders.json
+    """
+    orders = json.loads(file.read_text())
+    if not isinstance(orders, list) or not orders:
+        console.print("[red]Error: batch file must contain a list of orders[/red]")
+        raise typer.Exit(code=1)
+
+    for order in orders:
+        for key in ("symbol", "side", "type"):
+            if key in order:
+                order[key] = str(order[key]).upper()
+
+    async def execute():
+        async with _open_service() as service:
+            results = await service.place_batch_orders(orders=orders)
+
+            placed = [result for result in results if "orderId" in result]
+            rejected = [result for result in results if "orderId" not in result]
+
+            if placed:
+                console.print(f"\n[green]✓ {len(placed)} Orders Placed[/green]")
+                _display_orders(placed)
+            for result in rejected:
+                console.print(
+                    f"\n[red]✗ Order rejected: {result.get('msg', result)}[/red]"
+                )
+
+    run_async(execute())
+
+
 @app.command("price")
 def get_price(
     symbol: str = typer.Argument(..., help="Trading pair (e.g., BTCUSDT)"),
+    watch: bool = typer.Option(
+        False, "--watch", "-w", help="Keep printing live prices from the WebSocket"
+    ),
 ):
     """
     Get current market price for a symbol
@@ -177,18 +346,27 @@ def get_price(
     """
 
     async def execute():
-        async with TradeService(
-            logger=state.logger,
-            testnet=state.testnet,
-            api_key=state.api_key,
-            secret_key=state.secret_key,
-        ) as service:
-            price = await service.get_current_price(symbol.upper())
+        async with _open_service() as service:
+            price = await service.get_current_price(symbol=symbol.upper())
             console.print(
                 f"\n[cyan]{symbol.upper()}:[/cyan] [green]${price:,.2f}[/green]"
             )
 
-    run_async(execute())
+    async def watch_prices():
+        async with _new_service(client=await _shared_client()) as service:
+            async for price in service.stream_price(symbol=symbol.upper()):
+                console.print(
+                    f"[cyan]{symbol.upper()}:[/cyan] [green]${price:,.2f}[/green]"
+                )
+
+    if not watch:
+        run_async(execute())
+        return
+
+    try:
+        run_async(watch_prices())
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching[/yellow]")
 
 
 @app.command("balance")
@@ -200,12 +378,7 @@ def get_balance():
     """
 
     async def execute():
-        async with TradeService(
-            logger=state.logger,
-            testnet=state.testnet,
-            api_key=state.api_key,
-            secret_key=state.secret_key,
-        ) as service:
+        async with _open_service() as service:
             balance = await service.get_account_balance()
             console.print(
                 f"\n[cyan]Account Balance:[/cyan] [green]${balance:,.2f} USDT[/green]"
@@ -225,39 +398,12 @@ def list_orders(
     """
 
     async def execute():
-        async with TradeService(
-            logger=state.logger,
-            testnet=state.testnet,
-            api_key=state.api_key,
-            secret_key=state.secret_key,
-        ) as service:
+        async with _open_service() as service:
             orders = await service.get_open_orders(
                 symbol=symbol.upper() if symbol else None
             )
 
-            if not orders:
-                console.print("\n[yellow]No open orders found[/yellow]")
-                return
-
-            table = Table(title=f"Open Orders ({len(orders)})")
-            table.add_column("Order ID", style="cyan")
-            table.add_column("Symbol", style="magenta")
-            table.add_column("Side", style="yellow")
-            table.add_column("Type", style="blue")
-            table.add_column("Quantity", style="green")
-            table.add_column("Price", style="green")
-
-            for order in orders:
-                table.add_row(
-                    str(order["orderId"]),
-                    order["symbol"],
-                    order["side"],
-                    order["type"],
-                    str(order["origQty"]),
-                    str(order.get("price", "N/A")),
-                )
-
-            console.print(table)
+            await _display_open_orders(orders)
 
     run_async(execute())
 
@@ -273,45 +419,39 @@ def get_position(
     """
 
     async def execute():
-        async with TradeService(
-            logger=state.logger,
-            testnet=state.testnet,
-            api_key=state.api_key,
-            secret_key=state.secret_key,
-        ) as service:
+        async with _open_service() as service:
             positions = await service.get_position_info(
                 symbol=symbol.upper() if symbol else None
             )
 
-            # Filter out zero positions
-            active_positions = [
-                p for p in positions if float(p.get("positionAmt", 0)) != 0
-            ]
-
-            if not active_positions:
-                console.print("\n[yellow]No active positions[/yellow]")
-                return
-
-            table = Table(title="Active Positions")
-            table.add_column("Symbol", style="cyan")
-            table.add_column("Amount", style="yellow")
-            table.add_column("Entry Price", style="green")
-            table.add_column("Mark Price", style="green")
-            table.add_column("PnL", style="magenta")
-
-            for pos in active_positions:
-                pnl = float(pos.get("unRealizedProfit", 0))
-                pnl_color = "green" if pnl >= 0 else "red"
-
-                table.add_row(
-                    pos["symbol"],
-                    pos["positionAmt"],
-                    pos["entryPrice"],
-                    pos["markPrice"],
-                    f"[{pnl_color}]${pnl:,.2f}[/{pnl_color}]",
-                )
+            _display_positions(positions)
+
+    run_async(execute())
+
+
+@app.command("dashboard")
+def dashboard():
+    """
+    Show balance, active positions and open orders in one go
+
+    The three lookups run concurrently over a single connection.
+
+    Example: dashboard
+    """
+
+    async def execute():
+        async with _open_service() as service:
+            balance, positions, orders = await asyncio.gather(
+                service.get_account_balance(),
+                service.get_position_info(),
+                service.get_open_orders(),
+            )
 
-            console.print(table)
+            console.print(
+                f"\n[cyan]Account Balance:[/cyan] [green]${balance:,.2f} USDT[/green]"
+            )
+            _display_positions(positions)
+            await _display_open_orders(orders)
 
     run_async(execute())
 
@@ -328,36 +468,112 @@ def cancel_order(
     """
 
     async def execute():
-        async with TradeService(
-            logger=state.logger,
-            testnet=state.testnet,
-            api_key=state.api_key,
-            secret_key=state.secret_key,
-        ) as service:
-            result = await service.cancel_order(symbol.upper(), order_id)
+        async with _open_service() as service:
+            result = await service.cancel_order(
+                symbol=symbol.upper(), order_id=order_id
+            )
             console.print(f"\n[green]✓ Order {order_id} canceled successfully[/green]")
 
     run_async(execute())
 
 
+async def _display_open_orders(orders: list[dict]):
+    """Display open orders in a table, printing rows in chunks as they are ready"""
+    if not orders:
+        console.print("\n[yellow]No open orders found[/yellow]")
+        return
+
+    title = f"Open Orders ({len(orders)})"
+    rows = [_open_order_row(order) for order in orders]
+
+    if not console.is_terminal:
+        table = Table(title=title)
+        for label, style in _OPEN_ORDER_COLUMNS:
+            table.add_column(label, style=style)
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+        return
+
+    # Each chunk is printed once as its own edge-less table sharing fixed
+    # column widths; redrawing one growing table would cost O(rows^2)
+    widths = [
+        max(len(label), *(len(row[i]) for row in rows))
+        for i, (label, _) in enumerate(_OPEN_ORDER_COLUMNS)
+    ]
+    for start in range(0, len(rows), _ORDER_ROWS_PER_REFRESH):
+        first = start == 0
+        table = Table(
+            title=title if first else None,
+            show_header=first,
+            box=box.SIMPLE_HEAD,
+            show_edge=False,
+        )
+        for (label, style), width in zip(_OPEN_ORDER_COLUMNS, widths):
+            table.add_column(label, style=style, width=width, no_wrap=True)
+        for row in rows[start : start + _ORDER_ROWS_PER_REFRESH]:
+            table.add_row(*row)
+        console.print(table)
+        await asyncio.sleep(0)
+
+
+def _open_order_row(order: dict) -> tuple[str, ...]:
+    return (
+        str(order["orderId"]),
+        order["symbol"],
+        order["side"],
+        order["type"],
+        str(order["origQty"]),
+        str(order.get("price", "N/A")),
+    )
+
+
+def _is_open_position(position: dict) -> bool:
+    amount = position.get("positionAmt", "0")
+    # Most symbols report a zero string; skip float() parsing for those
+    if amount in _ZERO_AMOUNTS:
+        return False
+    return float(amount) != 0
+
+
+def _display_positions(positions: list[dict]):
+    """Display non-zero positions in a table"""
+    # Filter out zero positions
+    active_positions = [p for p in positions if _is_open_position(p)]
+
+    if not active_positions:
+        console.print("\n[yellow]No active positions[/yellow]")
+        return
+
+    table = Table(title="Active Positions")
+    table.add_column("Symbol", style="cyan")
+    table.add_column("Amount", style="yellow")
+    table.add_column("Entry Price", style="green")
+    table.add_column("Mark Price", style="green")
+    table.add_column("PnL", style="magenta")
+
+    for pos in active_positions:
+        pnl = float(pos.get("unRealizedProfit", 0))
+        pnl_color = "green" if pnl >= 0 else "red"
+
+        table.add_row(
+            pos["symbol"],
+            pos["positionAmt"],
+            pos["entryPrice"],
+            pos["markPrice"],
+            f"[{pnl_color}]${pnl:,.2f}[/{pnl_color}]",
+        )
+
+    console.print(table)
+
+
 def _display_order(order: dict):
     """Display order details in a formatted table"""
     table = Table(title="Order Details")
     table.add_column("Field", style="cyan")
     table.add_column("Value", style="green")
 
-    key_fields = [
-        ("Order ID", "orderId"),
-        ("Symbol", "symbol"),
-        ("Side", "side"),
-        ("Type", "type"),
-        ("Quantity", "origQty"),
-        ("Price", "price"),
-        ("Stop Price", "stopPrice"),
-        ("Status", "status"),
-    ]
-
-    for label, key in key_fields:
+    for label, key in _ORDER_FIELDS:
         value = order.get(key, "N/A")
         if value != "N/A":
             table.add_row(label, str(value))
@@ -365,5 +581,17 @@ def _display_order(order: dict):
     console.print(table)
 
 
+def _display_orders(orders: list[dict]):
+    """Display several placed orders as rows of a single table"""
+    table = Table(title=f"Placed Orders ({len(orders)})")
+    for label, _ in _ORDER_FIELDS:
+        table.add_column(label, style="cyan" if label == "Order ID" else "green")
+
+    for order in orders:
+        table.add_row(*(str(order.get(key, "")) for _, key in _ORDER_FIELDS))
+
+    console.print(table)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,134 @@
+import copy
+import functools
+import json
+import time
+from collections import OrderedDict
+
+_MISS = object()
+_MEMORY_MAXSIZE = 256
+
+# key -> (expires_at, value), oldest access first
+_memory_cache: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+
+def _copy(value):
+    # Callers get their own containers so mutating a result can't poison the cache
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
+def _memory_get(key: str):
+    entry = _memory_cache.get(key)
+    if entry is None:
+        return _MISS
+
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        del _memory_cache[key]
+        return _MISS
+
+    _memory_cache.move_to_end(key)
+    return _copy(value)
+
+
+def _memory_set(key: str, value, ttl: float):
+    _memory_cache[key] = (time.monotonic() + ttl, _copy(value))
+    _memory_cache.move_to_end(key)
+    if len(_memory_cache) > _MEMORY_MAXSIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _index_key(group: str) -> str:
+    return f"idx:{group}"
+
+
+def memoize(ttl: float, key, group=None):
+    """
+    Cache the result of an async TradeService method for `ttl` seconds
+
+    Lookups go to an in-process cache first, then to Redis when the service
+    has a `redis` client, and only then to the wrapped method. Redis errors
+    are logged and treated as a miss so caching never blocks a request.
+
+    Args:
+        ttl: Seconds a cached value stays valid
+        key: Callable receiving the method's arguments (including self)
+            and returning the cache key
+        group: Optional callable like `key` returning a group name. Keys of
+            a group must start with "<group>:"; Redis tracks them in a set
+            so invalidate() can drop the group without scanning keys.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache_key = key(self, *args, **kwargs)
+
+            value = _memory_get(cache_key)
+            if value is not _MISS:
+                return value
+
+            redis = getattr(self, "redis", None)
+            if redis is not None:
+                try:
+                    raw = await redis.get(cache_key)
+                except Exception as e:
+                    self.logger.warning("Redis GET {} failed: {}", cache_key, e)
+                    raw = None
+                if raw is not None:
+                    value = json.loads(raw)
+                    _memory_set(cache_key, value, ttl)
+                    return value
+
+            value = await func(self, *args, **kwargs)
+            _memory_set(cache_key, value, ttl)
+
+            if redis is not None:
+                try:
+                    async with redis.pipeline(transaction=False) as pipe:
+                        pipe.set(cache_key, json.dumps(value), px=int(ttl * 1000))
+                        if group is not None:
+                            index = _index_key(group(self, *args, **kwargs))
+                            pipe.sadd(index, cache_key)
+                            pipe.pexpire(index, int(ttl * 1000))
+                        await pipe.execute()
+                except Exception as e:
+                    self.logger.warning("Redis SET {} failed: {}", cache_key, e)
+
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate(service, *keys: str, groups=()):
+    """
+    Drop cached entries by exact key and by memoize() group
+
+    Clears both the in-process layer and, when the service has a `redis`
+    client, the matching Redis keys: exact keys are deleted directly and
+    group members are read from their index set, so no keyspace SCAN is
+    needed. Redis errors are logged, not raised.
+    """
+    for key in keys:
+        _memory_cache.pop(key, None)
+    prefixes = tuple(f"{group}:" for group in groups)
+    if prefixes:
+        for key in [key for key in _memory_cache if key.startswith(prefixes)]:
+            del _memory_cache[key]
+
+    redis = getattr(service, "redis", None)
+    if redis is None:
+        return
+
+    try:
+        doomed = list(keys)
+        for group in groups:
+            index = _index_key(group)
+            members = await redis.smembers(index)
+            doomed.extend(m.decode() if isinstance(m, bytes) else m for m in members)
+            doomed.append(index)
+        if doomed:
+            await redis.delete(*doomed)
+    except Exception as e:
+        service.logger.warning("Redis invalidation failed: {}", e)
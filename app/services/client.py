@@ -0,0 +1,63 @@
+import asyncio
+
+import aiohttp
+from binance import AsyncClient
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+# loop -> [connector, users]: keep-alive connections pooled for every client
+# on that loop. Nobody's session owns the connector; it is reference counted
+# and closed when its last user releases it.
+_pools: dict[asyncio.AbstractEventLoop, list] = {}
+
+
+def shared_session_params() -> dict:
+    """
+    aiohttp session options that make clients share one connection pool
+
+    Each AsyncClient still gets its own session (and API key header), but
+    closing a client leaves the pooled TLS connections open for the next one.
+    Every call takes a reference on the pool; pair it with one
+    release_shared_connector() once the client is closed. Must be called
+    from inside the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None or pool[0].closed:
+        pool = _pools[loop] = [aiohttp.TCPConnector(), 0]
+    pool[1] += 1
+    return {"connector": pool[0], "connector_owner": False}
+
+
+async def release_shared_connector():
+    """Drop one pool reference; the last one closes the pooled connections"""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        return
+    pool[1] -= 1
+    if pool[1] <= 0:
+        del _pools[loop]
+        await pool[0].close()
+
+
+class FastAsyncClient(AsyncClient):
+    """AsyncClient that parses REST responses with orjson when it is installed"""
+
+    async def _handle_response(self, response):
+        if orjson is None:
+            return await super()._handle_response(response)
+
+        if not str(response.status).startswith("2"):
+            raise BinanceAPIException(response, response.status, await response.text())
+        try:
+            body = await response.read()
+            # Stock python-binance returns {} for an empty body
+            return orjson.loads(body) if body else {}
+        except ValueError:
+            txt = await response.text()
+            raise BinanceRequestException(f"Invalid Response: {txt}")
@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import json
+import os
+
+SOCKET_PATH = "/tmp/binance-bot.sock"
+
+# Max bytes per request/reply line; all-symbol position lists top asyncio's 64 KiB
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+def account_fingerprint(api_key: str) -> str:
+    """Short, non-reversible id used to match CLI calls to the daemon's account"""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+async def serve(service, testnet: bool, api_key: str, path: str = SOCKET_PATH):
+    """
+    Serve TradeService commands over a Unix socket until cancelled
+
+    Protocol is line-delimited JSON. Each request line is
+    {"method": "<name>", "params": {...}} and each response line is
+    either {"result": ...} or {"error": "<message>"}.
+    """
+    ping = {"testnet": testnet, "account": account_fingerprint(api_key)}
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError as e:  # includes LimitOverrunError
+                    # Discard the rest of the line so the reply isn't lost to a
+                    # reset from closing with unread data
+                    while chunk := await reader.read(65536):
+                        if b"\n" in chunk:
+                            break
+                    writer.write(
+                        json.dumps({"error": f"Request too large: {e}"}).encode()
+                        + b"\n"
+                    )
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+
+                try:
+                    request = json.loads(line)
+                    method = request["method"]
+                    if method == "ping":
+                        response = {"result": ping}
+                    else:
+                        result = await service.dispatch(
+                            method, **request.get("params", {})
+                        )
+                        response = {"result": result}
+                except Exception as e:
+                    response = {"error": str(e)}
+
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass  # client went away before reading its reply
+        finally:
+            writer.close()
+
+    if os.path.exists(path):
+        if await _probe(path) is not None:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        os.unlink(path)  # stale socket left by a crashed daemon
+
+    server = await asyncio.start_unix_server(handle, path=path, limit=STREAM_LIMIT)
+    os.chmod(path, 0o600)
+    service.logger.info("Daemon listening on {}", path)
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+        service.logger.info("Daemon stopped")
+
+
+async def _request(path: str, method: str, params: dict | None = None):
+    reader, writer = await asyncio.open_unix_connection(path, limit=STREAM_LIMIT)
+    try:
+        try:
+            writer.write(
+                json.dumps({"method": method, "params": params or {}}).encode()
+            )
+            writer.write(b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass  # daemon hung up mid-request (e.g. too large); read its reason
+        try:
+            line = await reader.readline()
+        except ConnectionError:
+            line = b""
+    finally:
+        writer.close()
+
+    if not line:
+        raise RuntimeError(
+            f"Daemon closed the connection without replying to {method} "
+            f"(requests are limited to {STREAM_LIMIT} bytes)"
+        )
+    response = json.loads(line)
+
+    if "error" in response:
+        raise RuntimeError(f"Daemon error: {response['error']}")
+    return response["result"]
+
+
+async def _probe(path: str):
+    try:
+        return await _request(path, "ping")
+    except (OSError, ValueError, RuntimeError):
+        return None
+
+
+class DaemonClient:
+    """
+    Proxy exposing the TradeService coroutine API over the daemon socket
+
+    Arguments travel as a JSON object, so commands must be called with
+    keyword arguments (e.g. get_current_price(symbol="BTCUSDT")).
+    """
+
+    def __init__(self, path: str = SOCKET_PATH):
+        self.path = path
+
+    async def dispatch(self, cmd_name: str, **kwargs):
+        return await _request(self.path, cmd_name, kwargs)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            if args:
+                raise TypeError(
+                    f"{name}() through the daemon takes keyword arguments only"
+                )
+            return await self.dispatch(name, **kwargs)
+
+        return call
+
+
+async def connect(testnet: bool, api_key: str, path: str = SOCKET_PATH):
+    """
+    Return a DaemonClient if a daemon for the same mode and account is running
+
+    Returns None when there is no daemon (or it serves a different account or
+    mode), in which case callers should open their own TradeService.
+    """
+    if not os.path.exists(path):
+        return None
+
+    info = await _probe(path)
+    if info is None:
+        return None
+    if info["testnet"] != testnet or info["account"] != account_fingerprint(api_key):
+        return None
+
+    return DaemonClient(path)
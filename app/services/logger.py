@@ -1,9 +1,48 @@
 from loguru import logger
+from datetime import datetime
+import importlib.util
+import os
 import sys
 
 
+def _is_trade(record) -> bool:
+    return "trade" in record["extra"]
+
+
+def _zstd(path: str):
+    import zstandard
+
+    archive = f"{path}.zst"
+    if os.path.exists(archive):
+        # Same collision handling as loguru's built-in compression: keep the
+        # existing archive under a timestamped name instead of overwriting it
+        root, ext = os.path.splitext(path)
+        created = datetime.fromtimestamp(os.path.getctime(archive))
+        stamp = created.strftime("%Y-%m-%d_%H-%M-%S_%f")
+        renamed = f"{root}.{stamp}{ext}.zst"
+        counter = 1
+        while os.path.exists(renamed):
+            counter += 1
+            renamed = f"{root}.{stamp}.{counter}{ext}.zst"
+        os.rename(archive, renamed)
+
+    with open(path, "rb") as src, open(archive, "wb") as dst:
+        zstandard.ZstdCompressor(level=3).copy_stream(src, dst)
+    os.remove(path)
+
+
+def _compression():
+    """Compress rotated logs with zstd if zstandard is installed, else zip"""
+    if importlib.util.find_spec("zstandard") is None:
+        return "zip"
+    return _zstd
+
+
 def setup_logger(verbose: bool = False):
+    # Sinks are enqueued so file writes and rotation happen on loguru's worker
+    # thread instead of blocking the event loop while orders are in flight.
     logger.remove()
+    compression = _compression()
 
     if verbose:
         logger.add(
@@ -11,6 +50,9 @@ def setup_logger(verbose: bool = False):
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
             level="INFO",
             colorize=True,
+            enqueue=True,
+            catch=True,
+            diagnose=False,
         )
 
     logger.add(
@@ -19,7 +61,10 @@ def setup_logger(verbose: bool = False):
         level="DEBUG",
         rotation="00:00",
         retention="30 days",
-        compression="zip",
+        compression=compression,
+        enqueue=True,
+        catch=True,
+        diagnose=False,
     )
 
     logger.add(
@@ -28,16 +73,20 @@ def setup_logger(verbose: bool = False):
         level="ERROR",
         rotation="00:00",
         retention="90 days",
-        compression="zip",
+        compression=compression,
+        enqueue=True,
     )
 
     logger.add(
         "logs/trades_{time:YYYY-MM-DD}.log",
         format="{time:YYYY-MM-DD HH:mm:ss} | {message}",
-        filter=lambda record: "trade" in record["extra"],
+        filter=_is_trade,
         rotation="00:00",
         retention="365 days",
-        compression="zip",
+        compression=compression,
+        enqueue=True,
+        catch=True,
+        diagnose=False,
     )
 
     logger.info("Logger initialized successfully")
@@ -1,4 +1,9 @@
-from binance import AsyncClient
+import asyncio
+import functools
+import time
+from decimal import Decimal
+
+from binance import AsyncClient, BinanceSocketManager
 from binance.enums import (
     FUTURE_ORDER_TYPE_MARKET,
     ORDER_TYPE_LIMIT,
@@ -11,36 +16,159 @@ import binance
 # from loguru import Logger
 
 from app.core.config import settings
+from app.services.cache import invalidate, memoize
+from app.services.client import (
+    FastAsyncClient,
+    release_shared_connector,
+    shared_session_params,
+)
+from app.services.daemon import account_fingerprint
+
+_VALID_SIDES = frozenset({SIDE_BUY, SIDE_SELL})
+
+# Maximum orders Binance accepts in one /fapi/v1/batchOrders request
+BATCH_ORDER_LIMIT = 5
+
+# Seconds a streamed price may be served before falling back to REST
+PRICE_STREAM_MAX_AGE = 1.0
+
+
+def _api_value(value) -> str:
+    """Stringify an order field the way Binance expects ('true', '0.00001')"""
+    if isinstance(value, bool):  # before float/int: bool is an int subclass
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return format(Decimal(repr(value)), "f")
+    return str(value)
+
+
+async def create_client(logger, testnet: bool, api_key: str, secret_key: str):
+    """Open an AsyncClient for the testnet or live futures API"""
+    session_params = shared_session_params()
+    try:
+        client = await FastAsyncClient.create(
+            api_key, secret_key, testnet=testnet, session_params=session_params
+        )
+    except BaseException:
+        # create() closed its own session; give back the pool reference too
+        await release_shared_connector()
+        raise
+
+    if testnet:
+        logger.info("Connected to Binance Futures TESTNET")
+    else:
+        logger.warning("Connected to REAL Binance Futures - USE WITH CAUTION")
+    return client
+
+
+async def close_client(client):
+    """Close a client from create_client and release its connection pool"""
+    await client.close_connection()
+    await release_shared_connector()
 
 
 class TradeService:
+    # Methods that may be invoked by name through dispatch()
+    COMMANDS = frozenset(
+        {
+            "place_futures_market_order",
+            "place_futures_limit_order",
+            "place_stop_limit_order",
+            "place_batch_orders",
+            "get_current_price",
+            "get_account_balance",
+            "cancel_order",
+            "get_open_orders",
+            "get_position_info",
+        }
+    )
+
     def __init__(
         self,
         logger,
         testnet: bool = settings.TESTNET,
         api_key: str = settings.API_KEY,
         secret_key: str = settings.SECRET_KEY,
+        redis_url: str = settings.REDIS_URL,
+        client: AsyncClient | None = None,
+        stream_prices: bool = False,
     ):
         self.logger = logger
         self.testnet: bool = testnet
         self.api_key: str = api_key
         self.secret_key: str = secret_key
-        self.client = None
+        self.redis_url: str = redis_url
+        # An injected client is reused as-is and left open for its owner to close
+        self.client = client
+        self._owns_client = False
+        self.redis = None
+
+        # With stream_prices, get_current_price subscribes to the symbol's
+        # ticker WebSocket and answers from the last tick while it is fresh
+        self.stream_prices: bool = stream_prices
+        self._last_px: dict[str, tuple[float, float]] = {}
+        self._price_streams: dict[str, asyncio.Task] = {}
+
+        # Cache key prefixes: prices depend on the mode, balances on the account
+        self.market_ns: str = "testnet" if testnet else "live"
+        self.account_ns: str = f"{self.market_ns}:{account_fingerprint(api_key)}"
 
     async def __aenter__(self):
-        if self.testnet:
-            self.client = await AsyncClient.create(
-                self.api_key, self.secret_key, testnet=True
+        if self.client is None:
+            self.client = await create_client(
+                self.logger, self.testnet, self.api_key, self.secret_key
             )
-            self.logger.info("Connected to Binance Futures TESTNET")
-        else:
-            self.client = await AsyncClient.create(self.api_key, self.secret_key)
-            self.logger.warning("Connected to REAL Binance Futures - USE WITH CAUTION")
+            self._owns_client = True
+
+        self._bsm = BinanceSocketManager(self.client)
+
+        # Order calls with their per-type constant arguments already bound
+        self._market_order = functools.partial(
+            self.client.futures_create_order, type=FUTURE_ORDER_TYPE_MARKET
+        )
+        self._limit_order = functools.partial(
+            self.client.futures_create_order,
+            type=ORDER_TYPE_LIMIT,
+            timeInForce=TIME_IN_FORCE_GTC,  # Good Till Canceled
+        )
+        self._stop_limit_order = functools.partial(
+            self.client.create_order, type=ORDER_TYPE_STOP_LOSS_LIMIT
+        )
+
+        if self.redis_url:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError:
+                self.logger.warning("REDIS_URL is set but redis is not installed")
+            else:
+                self.redis = aioredis.from_url(self.redis_url)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.close_connection()
-        self.logger.info("Connection Closed")
+        streams = list(self._price_streams.values())
+        for task in streams:
+            task.cancel()
+        await asyncio.gather(*streams, return_exceptions=True)
+
+        if self.redis is not None:
+            await self.redis.aclose()
+        if self._owns_client:
+            await close_client(self.client)
+            self.client = None
+            self._owns_client = False
+            self.logger.info("Connection Closed")
+
+    async def dispatch(self, cmd_name: str, **kwargs):
+        """Invoke a service command by name (used by the daemon)"""
+        if cmd_name not in self.COMMANDS:
+            raise ValueError(f"Unknown command: {cmd_name}")
+        return await getattr(self, cmd_name)(**kwargs)
+
+    async def _account_changed(self):
+        # Orders and cancels change balance and positions; drop cached copies
+        await invalidate(
+            self, f"bal:{self.account_ns}", groups=(f"pos:{self.account_ns}",)
+        )
 
     async def place_futures_market_order(self, symbol: str, side: str, quantity: float):
         """
@@ -55,27 +183,32 @@ class TradeService:
             Order response dict
         """
         try:
-            if side not in [SIDE_BUY, SIDE_SELL]:
+            if side not in _VALID_SIDES:
                 raise ValueError(f"Invalid SIDE: {side}. Must be 'BUY' or 'SELL'")
 
-            self.logger.info(f"Placing MARKET {side} order: {quantity} {symbol}")
-
-            order = await self.client.futures_create_order(
+            order = await self._market_order(
                 symbol=symbol,
                 side=side,  # 'BUY' or 'SELL'
-                type=FUTURE_ORDER_TYPE_MARKET,
                 quantity=quantity,
             )
 
             self.logger.bind(trade=True).info(
-                f"MARKET {side} | {symbol} | Qty: {quantity} | "
-                f"Order ID: {order['orderId']} | Status: {order['status']}"
+                "MARKET {side} | {symbol} | Qty: {qty} | "
+                "Order ID: {oid} | Status: {status}",
+                side=side,
+                symbol=symbol,
+                qty=quantity,
+                oid=order["orderId"],
+                status=order["status"],
             )
 
+            await self._account_changed()
             return order
 
         except Exception as e:
-            self.logger.error(f"Market order failed: {e}")
+            self.logger.error(
+                "Market order {} {} {} failed: {}", side, quantity, symbol, e
+            )
             raise
 
     async def place_futures_limit_order(
@@ -94,30 +227,39 @@ class TradeService:
             Order response dict
         """
         try:
-            if side not in [SIDE_BUY, SIDE_SELL]:
+            if side not in _VALID_SIDES:
                 raise ValueError(f"Invalid SIDE: {side}. Must be 'BUY' or 'SELL'")
 
-            self.logger.info(
-                f"Placing LIMIT {side} order: {quantity} {symbol} at {price}"
-            )
-            order = await self.client.futures_create_order(
+            order = await self._limit_order(
                 symbol=symbol,
                 side=side,
-                type=ORDER_TYPE_LIMIT,
-                timeInForce=TIME_IN_FORCE_GTC,  # Good Till Canceled
                 quantity=quantity,
                 price=price,
             )
 
             self.logger.bind(trade=True).info(
-                f"LIMIT {side} | {symbol} | Qty: {quantity} | Price: ${price} | "
-                f"Order ID: {order['orderId']} | Status: {order['status']}"
+                "LIMIT {side} | {symbol} | Qty: {qty} | Price: ${price} | "
+                "Order ID: {oid} | Status: {status}",
+                side=side,
+                symbol=symbol,
+                qty=quantity,
+                price=price,
+                oid=order["orderId"],
+                status=order["status"],
             )
 
+            await self._account_changed()
             return order
 
         except Exception as e:
-            self.logger.error(f"Limit order failed: {e}")
+            self.logger.error(
+                "Limit order {} {} {} at {} failed: {}",
+                side,
+                quantity,
+                symbol,
+                price,
+                e,
+            )
             raise
 
     async def place_stop_limit_order(
@@ -137,54 +279,186 @@ class TradeService:
             Order response dict
         """
         try:
-            if side not in [SIDE_BUY, SIDE_SELL]:
+            if side not in _VALID_SIDES:
                 raise ValueError(f"Invalid SIDE: {side}. Must be 'BUY' or 'SELL'")
 
-            self.logger.info(
-                f"Placing STOP_LIMIT {side} order: {quantity} {symbol} at {price} and stop price at {stop_price}"
-            )
-
-            order = await self.client.create_order(
+            order = await self._stop_limit_order(
                 symbol=symbol,
                 side=side,  # 'BUY' or 'SELL'
-                type=ORDER_TYPE_STOP_LOSS_LIMIT,
                 quantity=quantity,
                 price=price,
                 stopPrice=stop_price,
             )
 
             self.logger.bind(trade=True).info(
-                f"STOP_LIMIT {side} | {symbol} | Qty: {quantity} | "
-                f"Price: {price} | Stop Price : {stop_price}"
-                f"Order ID: {order['orderId']} | Status: {order['status']}"
+                "STOP_LIMIT {side} | {symbol} | Qty: {qty} | "
+                "Price: {price} | Stop Price: {stop_price} | "
+                "Order ID: {oid} | Status: {status}",
+                side=side,
+                symbol=symbol,
+                qty=quantity,
+                price=price,
+                stop_price=stop_price,
+                oid=order["orderId"],
+                status=order["status"],
             )
 
+            await self._account_changed()
             return order
 
         except Exception as e:
-            self.logger.error(f"Market order failed: {e}")
+            self.logger.error(
+                "Stop-limit order {} {} {} failed: {}", side, quantity, symbol, e
+            )
+            raise
+
+    async def place_batch_orders(self, orders: list[dict]):
+        """
+        Place several futures orders using Binance's batch endpoint
+
+        Orders are sent in chunks of BATCH_ORDER_LIMIT, all chunks concurrently.
+
+        Args:
+            orders: Order specs using Binance field names, each with at least
+                'symbol', 'side', 'type' and 'quantity'
+                (e.g., {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'LIMIT',
+                'quantity': 0.001, 'price': 50000, 'timeInForce': 'GTC'})
+
+        Returns:
+            List with one response dict per order, in input order. Rejected
+            orders are returned as Binance error dicts ('code' and 'msg').
+        """
+        try:
+            batch = []
+            for i, spec in enumerate(orders):
+                missing = {"symbol", "side", "type", "quantity"} - spec.keys()
+                if missing:
+                    raise ValueError(
+                        f"Order #{i + 1} is missing {', '.join(sorted(missing))}"
+                    )
+                if spec["side"] not in _VALID_SIDES:
+                    raise ValueError(
+                        f"Order #{i + 1}: invalid SIDE {spec['side']}. "
+                        "Must be 'BUY' or 'SELL'"
+                    )
+                batch.append({key: _api_value(value) for key, value in spec.items()})
+
+            self.logger.info("Placing batch of {} orders", len(batch))
+
+            chunks = [
+                batch[i : i + BATCH_ORDER_LIMIT]
+                for i in range(0, len(batch), BATCH_ORDER_LIMIT)
+            ]
+            responses = await asyncio.gather(
+                *(
+                    self.client.futures_place_batch_order(batchOrders=chunk)
+                    for chunk in chunks
+                ),
+                return_exceptions=True,
+            )
+
+            # A failed chunk must not hide orders other chunks already placed
+            results = []
+            for chunk, response in zip(chunks, responses):
+                if isinstance(response, Exception):
+                    code = getattr(response, "code", -1)
+                    results.extend({"code": code, "msg": str(response)} for _ in chunk)
+                else:
+                    results.extend(response)
+
+            for spec, result in zip(batch, results):
+                if "orderId" in result:
+                    self.logger.bind(trade=True).info(
+                        "BATCH {type} {side} | {symbol} | Qty: {qty} | "
+                        "Order ID: {oid} | Status: {status}",
+                        type=result["type"],
+                        side=result["side"],
+                        symbol=result["symbol"],
+                        qty=result["origQty"],
+                        oid=result["orderId"],
+                        status=result["status"],
+                    )
+                else:
+                    self.logger.error(
+                        "Batch order {} {} {} rejected: {}",
+                        spec["side"],
+                        spec["quantity"],
+                        spec["symbol"],
+                        result.get("msg"),
+                    )
+
+            if any("orderId" in result for result in results):
+                await self._account_changed()
+            return results
+
+        except Exception as e:
+            self.logger.error("Batch order failed: {}", e)
             raise
 
+    @memoize(ttl=1.0, key=lambda self, symbol: f"px:{self.market_ns}:{symbol}")
     async def get_current_price(self, symbol):
         """Get current market price for a symbol"""
+        if self.stream_prices:
+            tick = self._last_px.get(symbol)
+            if tick is not None and time.monotonic() - tick[1] < PRICE_STREAM_MAX_AGE:
+                return tick[0]
+
         try:
             ticker = await self.client.futures_symbol_ticker(symbol=symbol)
             price = float(ticker["price"])
-            self.logger.info(f"Current price for {symbol}: ${price}")
-            return price
+            self.logger.info("Current price for {}: ${}", symbol, price)
         except Exception as e:
-            self.logger.error(f"Failed to get price: {e}")
+            self.logger.error("Failed to get price: {}", e)
             raise
 
+        # Subscribe only once REST has confirmed the symbol: Binance sends
+        # nothing for unknown symbols and the socket would stay open forever
+        if self.stream_prices and symbol not in self._price_streams:
+            self._price_streams[symbol] = asyncio.create_task(self._watch_price(symbol))
+        return price
+
+    async def stream_price(self, symbol):
+        """
+        Yield the last traded price for a symbol from the futures ticker stream
+
+        Every tick also refreshes the price get_current_price serves when
+        stream_prices is enabled. Ends if the WebSocket reports an error.
+        """
+        socket = self._bsm.individual_symbol_ticker_futures_socket(symbol)
+        async with socket as stream:
+            self.logger.info("Subscribed to {} ticker stream", symbol)
+            while True:
+                msg = await stream.recv()
+                data = msg.get("data", msg)
+                if data.get("e") == "error":
+                    self.logger.error(
+                        "Ticker stream for {} failed: {}", symbol, data.get("m")
+                    )
+                    return
+
+                price = float(data["c"])
+                self._last_px[symbol] = (price, time.monotonic())
+                yield price
+
+    async def _watch_price(self, symbol):
+        try:
+            async for _ in self.stream_price(symbol):
+                pass
+        except Exception as e:
+            self.logger.warning("Ticker stream for {} stopped: {}", symbol, e)
+        finally:
+            self._price_streams.pop(symbol, None)
+
+    @memoize(ttl=2.0, key=lambda self: f"bal:{self.account_ns}")
     async def get_account_balance(self):
         """Get futures account balance"""
         try:
             account = await self.client.futures_account()
             balance = float(account["totalWalletBalance"])
-            self.logger.info(f"Account balance: ${balance:.2f} USDT")
+            self.logger.info("Account balance: ${:.2f} USDT", balance)
             return balance
         except Exception as e:
-            self.logger.error(f"Failed to get balance: {e}")
+            self.logger.error("Failed to get balance: {}", e)
             raise
 
     async def cancel_order(self, symbol, order_id):
@@ -193,30 +467,36 @@ class TradeService:
             result = await self.client.futures_cancel_order(
                 symbol=symbol, orderId=order_id
             )
-            self.logger.info(f"Order {order_id} canceled successfully")
+            self.logger.info("Order {} canceled successfully", order_id)
+            await self._account_changed()
             return result
         except Exception as e:
-            self.logger.error(f"Failed to cancel order: {e}")
+            self.logger.error("Failed to cancel order: {}", e)
             raise
 
     async def get_open_orders(self, symbol=None):
         """Get all open orders"""
         try:
             orders = await self.client.futures_get_open_orders(symbol=symbol)
-            self.logger.info(f"Found {len(orders)} open orders")
+            self.logger.info("Found {} open orders", len(orders))
             return orders
         except Exception as e:
-            self.logger.error(f"Failed to get open orders: {e}")
+            self.logger.error("Failed to get open orders: {}", e)
             raise
 
+    @memoize(
+        ttl=2.0,
+        key=lambda self, symbol=None: f"pos:{self.account_ns}:{symbol or '*'}",
+        group=lambda self, symbol=None: f"pos:{self.account_ns}",
+    )
     async def get_position_info(self, symbol=None):
         """Get current position information"""
         try:
             positions = await self.client.futures_position_information(symbol=symbol)
             self.logger.info(
-                f"Position info retrieved for {symbol if symbol else 'all symbols'}"
+                "Position info retrieved for {}", symbol if symbol else "all symbols"
             )
             return positions
         except Exception as e:
-            self.logger.error(f"Failed to get position info: {e}")
+            self.logger.error("Failed to get position info: {}", e)
             raise